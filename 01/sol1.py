@@ -1,15 +1,38 @@
 #!/usr/bin/env python
 
 import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+
+# blocks smaller than this go line by line: for them, importing numpy
+# costs more than it saves
+NUMPY_MIN = 1 << 16
 
 def extract_number(line):
     first = next(filter(str.isdigit, line))
     last  = next(filter(str.isdigit, reversed(line)))
     return int(first + last)
 
+def calibration_sum(buf):
+    # buf holds whole lines, each with at least one digit.
+    if len(buf) < NUMPY_MIN:
+        return sum(map(extract_number, buf.decode().splitlines()))
+    # no loop over lines: find every digit, tell which line it is on, and
+    # the first/last digit of a line are where that line number changes
+    import numpy as np
+    a = np.frombuffer(buf, dtype=np.uint8)
+    digits = np.flatnonzero((a >= ord('0')) & (a <= ord('9')))
+    if len(digits) == 0:
+        return 0
+    line = np.searchsorted(np.flatnonzero(a == ord('\n')), digits)
+    starts = np.flatnonzero(np.diff(line, prepend=-1))
+    ends = np.append(starts[1:] - 1, len(digits) - 1)
+    first = a[digits[starts]].sum(dtype=np.int64) - ord('0') * len(starts)
+    last  = a[digits[ends]].sum(dtype=np.int64) - ord('0') * len(ends)
+    return int(10 * first + last)
+
 def solve(file):
-    numbers = [ extract_number(l) for l in file.readlines() ]
-    return sum(numbers)
+    return sum(calibration_sum(block) for block in stream.blocks(file))
 
 def main():
     try:
@@ -2,33 +2,92 @@
 
 import sys, os
 from itertools import takewhile
+from collections import deque
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
 
 
 words = [ "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine" ]
 
+class Scanner:
+    # aho-corasick over bytes, as two complete DFAs: one for the patterns and
+    # one for the patterns reversed, so the last match can be found by
+    # scanning from the right and stopping at the first hit
+    def __init__(self, patterns: dict[bytes, int]):
+        self.maxlen = max(map(len, patterns))
+        self.fwd = Scanner.build(patterns)
+        self.bwd = Scanner.build({ p[::-1]: v for p, v in patterns.items() })
+
+    def build(patterns):
+        goto, out = [{}], [[]]
+        for pat, val in patterns.items():
+            st = 0
+            for c in pat:
+                if c not in goto[st]:
+                    goto[st][c] = len(goto)
+                    goto.append({})
+                    out.append([])
+                st = goto[st][c]
+            out[st].append((len(pat), val))
+        # bfs order, so a state's failure target is always done before it
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = [ goto[0].get(c, 0) for c in range(256) ]
+        queue = deque(goto[0].values())
+        while queue:
+            st = queue.popleft()
+            row = delta[fail[st]][:]
+            for c, nxt in goto[st].items():
+                fail[nxt] = delta[fail[st]][c]
+                row[c] = nxt
+                queue.append(nxt)
+            delta[st] = row
+            out[st] = sorted(out[st] + out[fail[st]], reverse=True)
+        return delta, out
+
+    def first(self, line: bytes):
+        # value of the match that starts leftmost. the first match to *end*
+        # may start later than a longer one still being read, so keep going
+        # until no pattern starting before the best so far can still end
+        delta, out = self.fwd
+        st, best, stop = 0, None, len(line)
+        i = 0
+        while i < stop:
+            st = delta[st][line[i]]
+            if out[st]:
+                length, val = out[st][0]
+                start = i - length + 1
+                if best is None or start < best[0]:
+                    best = (start, val)
+                    stop = min(stop, start + self.maxlen)
+            i += 1
+        return best and best[1]
+
+    def last(self, line: bytes):
+        # value of the match that starts rightmost: from the right, that is
+        # simply the first one to complete
+        delta, out = self.bwd
+        st = 0
+        for c in reversed(line):
+            st = delta[st][c]
+            if out[st]:
+                return out[st][0][1]
+        return None
+
+    def scan_lines(self, lines):
+        # (first, last) for each line in an iterable of bytes
+        first, last = self.first, self.last
+        return ( (first(l), last(l)) for l in lines )
+
+
+scanner = Scanner({
+    **{ str(d).encode(): d for d in range(10) },
+    **{ w.encode(): val for val, w in enumerate(words) },
+})
+
 def extract_number(line):
-    first_dig_i = next(filter(lambda i: line[i].isdigit(), range(len(line))), len(line))
-    last_dig_i  = next(filter(lambda i: line[i].isdigit(), range(len(line)-1, -1, -1)), -1)
-    left_words  = (
-        (i, wordval)
-        for wordval, word in enumerate(words)
-        if (i := line.find(word, 0, first_dig_i)) != -1
-    )
-    right_words  = (
-        (i, wordval)
-        for wordval, word in enumerate(words)
-        if (i := line.rfind(word, last_dig_i+1)) != -1
-    )
-    left_words, right_words = map(list, (left_words, right_words))
-    try:
-        _, first = min(left_words, key=lambda p: p[0])
-    except ValueError:
-        first = line[first_dig_i]
-    try:
-        _, last  = max(right_words, key=lambda p: p[0])
-    except ValueError:
-        last = line[last_dig_i]
-    return int(str(first) + str(last))
+    line = line.encode()
+    return 10 * scanner.first(line) + scanner.last(line)
 
 # def extract_number(line):
 #     import re
@@ -42,8 +101,8 @@ def extract_number(line):
 
 
 def solve(file):
-    numbers = [ extract_number(l.strip()) for l in file.readlines() ]
-    return sum(numbers)
+    lines = ( l.strip().encode() for l in stream.lines(file) )
+    return sum(10 * a + b for a, b in scanner.scan_lines(lines))
 
 def main():
     try:
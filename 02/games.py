@@ -0,0 +1,70 @@
+# pyright: basic
+
+# all games as one table of draws: an int32 row (game id, red, green, blue)
+# per draw, and the per-game maximum of each colour next to it. any bag
+# can be checked against the maxima without going back to the text.
+
+import sys, os, re
+from array import array
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+
+# how many (bag, game) comparisons id_sums does at once
+BATCH_CELLS = 1 << 22
+
+# a game header, a count of some colour, or the end of a draw
+TOKEN = re.compile(rb'Game (\d+)|(\d+) (?:(red)|(green)|(blue))|[;\n]')
+
+def tokenize(buf, rows):
+    # appends (game, r, g, b) for every draw in buf to rows
+    game, draw = 0, [0, 0, 0]
+    for m in TOKEN.finditer(buf):
+        k = m.lastindex
+        if k == 1:
+            game = int(m[1])
+        elif k is None:
+            rows.extend((game, *draw))
+            draw = [0, 0, 0]
+        else:
+            draw[k - 3] += int(m[2])
+
+
+class GameStore:
+    def __init__(self, draws):
+        self.draws = draws
+        game = draws[:, 0]
+        # draws of a game are next to each other
+        starts = np.flatnonzero(np.diff(game, prepend=-1))
+        self.ids = game[starts]
+        self.maxima = np.maximum.reduceat(draws[:, 1:], starts, axis=0)
+
+    def from_file(file):
+        rows = array('i')
+        for block in stream.blocks(file):
+            tokenize(block, rows)
+        return GameStore(np.frombuffer(rows, dtype=np.int32).reshape(-1, 4))
+
+    def admissible(self, totals):
+        # mask of the games that could be played with totals (r, g, b)
+        return (self.maxima <= np.asarray(totals)).all(axis=1)
+
+    def id_sum(self, totals):
+        return int(self.ids[self.admissible(totals)].sum(dtype=np.int64))
+
+    def id_sums(self, totals):
+        # id_sum for each row of a (k, 3) matrix of bags, in one go: the
+        # maxima are broadcast against a batch of bags at a time and the
+        # admissible masks summed against the ids as a matrix product
+        totals = np.asarray(totals).reshape(-1, 3)
+        ids = self.ids.astype(np.int64)
+        out = np.empty(len(totals), dtype=np.int64)
+        step = max(1, BATCH_CELLS // max(1, len(ids)))
+        for i in range(0, len(totals), step):
+            bags = totals[i:i+step, None, :]
+            ok = (self.maxima[None, :, :] <= bags).all(axis=2)
+            out[i:i+step] = ok @ ids
+        return out
+
+    def power_sum(self):
+        return int(self.maxima.astype(np.int64).prod(axis=1).sum())
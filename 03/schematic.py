@@ -0,0 +1,115 @@
+# pyright: basic
+
+# the engine schematic as images: every digit run gets a label, the labels
+# index an array of part values, and adjacency is a 3x3 neighbourhood
+# of the symbol cells. no python code runs per cell or per number.
+#
+# scan_rows does the same on a window of three rows sliding down the input,
+# for schematics too tall to hold: a row's numbers and stars only ever touch
+# the rows right above and below it.
+
+import numpy as np
+
+DOT, STAR = ord('.'), ord('*')
+
+
+def digit_mask(grid):
+    return (grid >= ord('0')) & (grid <= ord('9'))
+
+def label_numbers(grid):
+    # (labels, values): labels[y, x] is 1 + the index into values of the
+    # number covering that cell, 0 if there is none
+    isdig = digit_mask(grid)
+    h, w = grid.shape
+    # a spare column keeps runs from wrapping onto the next row
+    padded = np.zeros((h, w + 1), dtype=bool)
+    padded[:, :w] = isdig
+    flat = padded.ravel()
+    starts = flat & ~np.concatenate(([False], flat[:-1]))
+    labels = (np.cumsum(starts) * flat).reshape(h, w + 1)[:, :w]
+
+    digits = grid[isdig].astype(np.int64) - ord('0')
+    lab = labels[isdig]
+    run_start = np.flatnonzero(np.diff(lab, prepend=0))
+    run_len = np.diff(np.append(run_start, len(lab)))
+    # place value of each digit: 10 ** (digits left in its run)
+    pos = np.arange(len(lab)) - np.repeat(run_start, run_len)
+    power = np.repeat(run_len, run_len) - 1 - pos
+    values = np.add.reduceat(digits * 10 ** power, run_start) if len(lab) else digits
+    return labels, values
+
+def neighbourhoods(labels, ys, xs):
+    # (n, 9) labels around each of the cells (ys, xs), 0 off the grid
+    padded = np.pad(labels, 1)
+    return np.stack([
+        padded[ys + 1 + dy, xs + 1 + dx]
+        for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+    ], axis=1)
+
+def part_numbers(grid, labels):
+    # labels of the numbers next to at least one symbol
+    symbol = ~digit_mask(grid) & (grid != DOT)
+    ys, xs = np.nonzero(symbol)
+    near = neighbourhoods(labels, ys, xs).ravel()
+    return np.unique(near[near > 0])
+
+def gear_pairs(grid, labels, rows=slice(None)):
+    # (n, 2) pairs of labels: the two numbers next to each '*' that has
+    # exactly two, only looking at stars in rows. the star-number adjacency
+    # is kept sparse, as sorted unique (star, label) keys
+    stars = np.zeros(grid.shape, dtype=bool)
+    stars[rows] = grid[rows] == STAR
+    ys, xs = np.nonzero(stars)
+    near = neighbourhoods(labels, ys, xs)
+    star = np.repeat(np.arange(len(ys), dtype=np.int64), 9)
+    lab = near.ravel().astype(np.int64)
+    keep = lab > 0
+    keys = np.unique(star[keep] * (labels.max() + 1) + lab[keep])
+    star, lab = np.divmod(keys, labels.max() + 1)
+    counts = np.bincount(star, minlength=len(ys))
+    first = np.searchsorted(star, np.flatnonzero(counts == 2))
+    return np.stack([lab[first], lab[first + 1]], axis=1)
+
+
+def part_number_sum(grid):
+    labels, values = label_numbers(grid)
+    return int(values[part_numbers(grid, labels) - 1].sum())
+
+def gear_ratio_sum(grid):
+    labels, values = label_numbers(grid)
+    pairs = gear_pairs(grid, labels)
+    return int((values[pairs[:, 0] - 1] * values[pairs[:, 1] - 1]).sum())
+
+
+def scan_rows(rows):
+    # rows: iterable of equal-length uint8 arrays. yields, for each row once
+    # the one below it has been seen, (part values, gear ratios) of the
+    # numbers and stars in that row
+    blank = None
+    window = []
+    for row in rows:
+        if blank is None:
+            blank = np.full_like(row, DOT)
+            window = [blank]
+        window.append(row)
+        if len(window) == 3:
+            yield scan_window(np.stack(window))
+            window.pop(0)
+    if len(window) == 2:
+        window.append(blank)
+        yield scan_window(np.stack(window))
+
+def scan_window(window):
+    labels, values = label_numbers(window)
+    mid = np.unique(labels[1])
+    parts = np.intersect1d(part_numbers(window, labels), mid[mid > 0])
+    pairs = gear_pairs(window, labels, rows=1)
+    return values[parts - 1], values[pairs[:, 0] - 1] * values[pairs[:, 1] - 1]
+
+def stream_sums(rows):
+    # (part number sum, gear ratio sum) holding three rows at a time
+    part_sum = gear_sum = 0
+    for parts, ratios in scan_rows(rows):
+        part_sum += int(parts.sum())
+        gear_sum += int(ratios.sum())
+    return part_sum, gear_sum
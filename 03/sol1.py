@@ -1,59 +1,28 @@
 #!/usr/bin/env python
 
-import sys, os, re
-from itertools import chain
+import sys, os
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+from gridio import load_grid
+from schematic import part_number_sum, stream_sums
 
 
-def surroundings(x, y, w, h):
-    yield from (
-        (nx, y-1)
-        for nx in range(x-1, x+w+1)
-    )
-    for ny in range(y, y+h):
-        yield (x-1, ny)
-        yield (x+w, ny)
-    yield from (
-        (nx, y+h)
-        for nx in range(x-1, x+w+1)
-    )
-
 def solve(file):
-    data = file.read().splitlines()
-    grid = Grid(data)
-    regex = re.compile('\d+')
-    # iter of (x: int, y: int, w: int) 
-    all_numbers_pos = chain.from_iterable(
-            ( (m.start(), y, m.end()-m.start()) for m in regex.finditer(row) )
-            for y, row in enumerate(grid.rows)
-    )
-    good_numbers = (
-            int(grid[x:x+w, y])
-            for x, y, w in all_numbers_pos
-            if not all( c.isdigit() or c == '.' for c in grid.neighbors(x, y, w, 1) )
-    )
-    return sum(good_numbers)
-
+    return part_number_sum(load_grid(file))
 
-class Grid:
-    def __init__(self, data):
-        self.rows = data
-        self.w = len(data[0])
-        self.h = len(data)
-    def __getitem__(self, index):
-        x, y = index
-        return self.rows[y][x]
-    def in_bounds(self, x, y):
-        return 0 <= x < self.w and 0 <= y < self.h
-    def neighbors(self, x, y, w, h):
-        return ( self[x, y] for x, y in surroundings(x, y, w, h) if self.in_bounds(x, y) )
+# three rows in memory at a time, for pipes of unknown length
+def solve_stream(file):
+    rows = ( np.frombuffer(line.encode(), dtype=np.uint8) for line in stream.lines(file) )
+    return stream_sums(rows)[0]
 
 def main():
     try:
         file = open(sys.argv[1])
     except IndexError:
-        file = sys.stdin
-
-    sol = solve(file)
+        sol = solve_stream(sys.stdin)
+    else:
+        sol = solve(file)
     print(f'Solution: {sol}')
 
 
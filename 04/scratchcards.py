@@ -0,0 +1,18 @@
+# pyright: basic
+
+# scratchcards with each side as one int: numbers are < 100, so a side fits
+# in an int as a bitset, and the numbers on a side are distinct, so their
+# bits can just be added. the matches of a card are then one & and a
+# bit_count.
+
+import re
+
+BIT = { str(n): 1 << n for n in range(100) }
+
+
+def to_bits(numbers):
+    return sum(map(BIT.__getitem__, numbers.split()))
+
+def extract_card(line):
+    id, winning, own = re.match(r'Card\s+(\d+): ([\d\s]+) \| ([\d\s]+)', line).groups()
+    return (id, to_bits(winning), to_bits(own))
@@ -1,21 +1,20 @@
 #!/usr/bin/env python
 
-import sys, re
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+from scratchcards import extract_card
 
-def extract_card(line):
-    id, winning, own = re.match(r'Card\s+(\d+): ([\d\s]+) \| ([\d\s]+)', line).groups()
-    winning, own = winning.split(), own.split()
-    return (id, winning, own)
 
 def worth(card):
     _, winning, own = card
-    count = sum( (n in winning) for n in own )
+    count = (winning & own).bit_count()
     val = (1 << (count-1)) if count > 0 else 0
     return val
 
 
 def solve(file):
-    cards = ( extract_card(line) for line in file.readlines() )
+    cards = ( extract_card(line) for line in stream.lines(file) )
     return sum(worth(card) for card in cards)
 
 def main():
@@ -1,27 +1,35 @@
 #!/usr/bin/env python
 
-import sys, re
+import sys, os
+from collections import deque
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+from scratchcards import extract_card
 
-def extract_card(line):
-    id, winning, own = re.match(r'Card\s+(\d+): ([\d\s]+) \| ([\d\s]+)', line).groups()
-    winning, own = winning.split(), own.split()
-    return (id, winning, own)
 
 def matches_count(winning, own):
-    count = sum( (n in winning) for n in own )
+    count = (winning & own).bit_count()
     return count
 
 def solve(file):
-    cards = ( extract_card(line) for line in file.readlines() )
-    cards = { int(id): (winning, own, 1) for id, winning, own in cards }
-    for id in cards.keys():
-        winning, own, copies = cards[id]
+    cards = ( extract_card(line) for line in stream.lines(file) )
+    # difference array of extra copies over the cards to come, starting at
+    # the next one. only the next (most matches a card can have) cards are
+    # ever touched, so it is kept as a queue that far ahead
+    diff = deque()
+    extra = 0
+    total = 0
+    for _, winning, own in cards:
+        copies = 1 + extra
+        total += copies
         matches = matches_count(winning, own)
-        for d in range(1, matches+1):
-            w, o, k = cards[id+d]
-            cards[id+d] = w, o, k+copies
+        if matches:
+            diff.extend([0] * (matches + 1 - len(diff)))
+            diff[0] += copies
+            diff[matches] -= copies
+        extra += diff.popleft() if diff else 0
 
-    return sum(copies for _, _, copies in cards.values())
+    return total
 
 def main():
     try:
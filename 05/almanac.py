@@ -0,0 +1,152 @@
+# pyright: basic
+
+# the almanac's maps as piecewise-linear functions on the non-negative
+# integers: sorted piece starts, each with the offset it adds, covering
+# everything from 0 up. numbers no line of a map mentions are pieces with
+# offset 0. a lookup is one bisect, and compose() folds all the stages into
+# one map, so a seed's location is a single lookup however many stages
+# there are.
+# lookup_many does the same for a whole numpy array of numbers at once.
+#
+# ranges of numbers go through the stages as interval sets: sorted, disjoint
+# ranges that are merged again after every stage. a stage only cuts them
+# at its breakpoints, so their number grows by at most the breakpoints of
+# each map, however the ranges happened to be split before.
+
+import re
+from bisect import bisect_right
+from functools import reduce
+from itertools import takewhile
+
+# how many numbers lookup_many holds as int64 temporaries at once
+BATCH = 1 << 22
+
+MAPNAMES = [ 'seed-to-soil', 'soil-to-fertilizer', 'fertilizer-to-water', 'water-to-light', 'light-to-temperature', 'temperature-to-humidity', 'humidity-to-location' ]
+
+
+class Map:
+    # piece i is starts[i] <= n < starts[i+1] (the last one has no end)
+    # and sends n to n + deltas[i]; starts[0] == 0
+    def __init__(self, starts, deltas):
+        self.starts = starts
+        self.deltas = deltas
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        # ranges: (dst start, src start, length) as in the almanac
+        starts, deltas = [0], [0]
+        end = 0
+        for dst, src, length in sorted(ranges, key=lambda r: r[1]):
+            if src < end:
+                raise ValueError(f'overlapping ranges at {src}')
+            if src > end:
+                starts.append(end)
+                deltas.append(0)
+            starts.append(src)
+            deltas.append(dst - src)
+            end = src + length
+        starts.append(end)
+        deltas.append(0)
+        return cls(starts, deltas).coalesced()
+
+    def coalesced(self):
+        # the same map without empty pieces or neighbours with equal offsets
+        starts, deltas = [], []
+        for i, (s, d) in enumerate(zip(self.starts, self.deltas)):
+            if i + 1 < len(self.starts) and self.starts[i+1] == s:
+                continue
+            if deltas and deltas[-1] == d:
+                continue
+            starts.append(s)
+            deltas.append(d)
+        return Map(starts, deltas)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, n):
+        return n + self.deltas[bisect_right(self.starts, n) - 1]
+
+    def lookup_many(self, ns):
+        # self[n] for every n of an int64 array
+        import numpy as np
+        starts = np.array(self.starts, dtype=np.int64)
+        deltas = np.array(self.deltas, dtype=np.int64)
+        return ns + deltas[np.searchsorted(starts, ns, side='right') - 1]
+
+    def then(self, other):
+        # the map n -> other[self[n]]: every piece of self is cut where its
+        # image crosses a start of other
+        starts, deltas = [], []
+        for i, (a, d) in enumerate(zip(self.starts, self.deltas)):
+            end = self.starts[i+1] + d if i + 1 < len(self.starts) else None
+            j = bisect_right(other.starts, a + d) - 1
+            starts.append(a)
+            deltas.append(d + other.deltas[j])
+            for j in range(j + 1, len(other.starts)):
+                if end is not None and other.starts[j] >= end:
+                    break
+                starts.append(other.starts[j] - d)
+                deltas.append(d + other.deltas[j])
+        return Map(starts, deltas).coalesced()
+
+    def image(self, r: range) -> list[range]:
+        # the numbers r is sent to, one range per piece it meets
+        out = []
+        i = bisect_right(self.starts, r.start) - 1
+        start = r.start
+        while start < r.stop:
+            stop = min(self.starts[i+1], r.stop) if i + 1 < len(self.starts) else r.stop
+            out.append(range(start + self.deltas[i], stop + self.deltas[i]))
+            start = stop
+            i += 1
+        return out
+
+
+def compose(maps) -> Map:
+    # one map doing all of maps, first to last
+    return reduce(Map.then, maps)
+
+def min_image(m, ns):
+    # min(m[n] for n in ns), BATCH numbers of the int64 array ns at a time
+    return min(
+        int(m.lookup_many(ns[i:i+BATCH]).min())
+        for i in range(0, len(ns), BATCH)
+    )
+
+def coalesce(ranges) -> list[range]:
+    # ranges sorted by start, without empty ones, overlapping or touching
+    # ones merged
+    out = []
+    for r in sorted(ranges, key=lambda r: r.start):
+        if not r:
+            continue
+        if out and r.start <= out[-1].stop:
+            if r.stop > out[-1].stop:
+                out[-1] = range(out[-1].start, r.stop)
+        else:
+            out.append(r)
+    return out
+
+def push(ranges, maps):
+    # yields the interval set ranges is sent to after each of maps in turn
+    ranges = coalesce(ranges)
+    for m in maps:
+        ranges = coalesce( piece for r in ranges for piece in m.image(r) )
+        yield ranges
+
+def parse_map(lines) -> Map:
+    return Map.from_ranges(
+        tuple(map(int, line.split()))
+        for line in lines
+    )
+
+def parse_maps(f) -> list[Map]:
+    # the maps in MAPNAMES order, from just after the seeds line
+    # skip empty
+    assert f.readline().isspace()
+    maps = []
+    for mapname in MAPNAMES:
+        assert re.match(f'{mapname} map:', f.readline())
+        maps.append(parse_map(takewhile(lambda line: not line.isspace(), f)))
+    return maps
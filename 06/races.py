@@ -0,0 +1,49 @@
+# pyright: basic
+
+# ways to beat the record of a race, in exact integer arithmetic.
+# holding the button t ms of a T ms race goes t * (T - t) mm, which beats
+# the record d for the t strictly between the roots of t^2 - T t + d = 0.
+# that is every t in [lo, T - lo], lo the first winning one, and lo is
+# (T - isqrt(T^2 - 4d)) // 2 or the integer after it.
+#
+# ways_many does whole arrays of races. while the squares fit in an int64
+# the square root is numpy's, made exact by checking its neighbours;
+# bigger races fall back to isqrt one at a time, which works for any size.
+
+from math import isqrt
+
+# T * T and 4 * d must fit in an int64 for the numpy path. every race that
+# can be won with T <= MAX_T has d < T * T / 4 <= MAX_D
+MAX_T = 3_000_000_000
+MAX_D = (1 << 61) - 1
+
+
+def ways(T, d):
+    disc = T * T - 4 * d
+    if disc < 0:
+        return 0
+    lo = (T - isqrt(disc)) // 2
+    if lo * (T - lo) <= d:
+        lo += 1
+    return max(T - 2 * lo + 1, 0)
+
+def ways_many(times, distances):
+    import numpy as np
+    # python ints too big for numpy come out as object arrays
+    T = np.asarray(times)
+    d = np.asarray(distances)
+    if T.dtype.kind not in 'iu' or d.dtype.kind not in 'iu' or not len(T) \
+            or T.max() > MAX_T or d.max() > MAX_D or min(T.min(), d.min()) < 0:
+        return np.array([ ways(int(t), int(r)) for t, r in zip(T, d) ], dtype=object)
+    T = T.astype(np.int64)
+    d = d.astype(np.int64)
+    disc = T * T - 4 * d
+    ok = disc >= 0
+    disc = np.where(ok, disc, 0)
+    # floor(sqrt()) in floats can be one off either way for big discs
+    s = np.floor(np.sqrt(disc.astype(np.float64))).astype(np.int64)
+    s -= s * s > disc
+    s += (s + 1) * (s + 1) <= disc
+    lo = (T - s) // 2
+    lo += lo * (T - lo) <= d
+    return np.where(ok, np.maximum(T - 2 * lo + 1, 0), 0)
@@ -1,9 +1,7 @@
 #!/usr/bin/env python
 
 import sys, re
-from math import floor, ceil
-from operator import mul
-from functools import reduce
+from races import ways
 
 def parse_file(f):
     time = re.match(r'Time:\s+(.+)', f.readline())
@@ -21,20 +19,7 @@ def solve(time, distance):
     # delta = T**2 - 4*dist
     # L = -b/2 - sqrt(delta)/2      R = -b/2 + sqrt(delta)/2
     # the length of the line is R-L --> sqrt(delta)
-    return get_range(time, distance)
-
-def get_range(T, d):
-    delta = T**2 - 4*d
-    # x of vertex
-    vx = T/2
-    # distance to roots
-    rad = delta**0.5/2
-    # roots
-    l, r = vx - rad, vx + rad
-    # we want the integers strictly between l and r
-    l = floor(l + 1)
-    r = ceil(r - 1)
-    return r - l + 1
+    return ways(time, distance)
 
 def main():
     try:
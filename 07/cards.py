@@ -0,0 +1,70 @@
+# pyright: basic
+
+# camel cards hands as single ints that sort like the hands do: the type
+# in the high bits and the five card ranks below it, 4 bits each, first
+# card highest. a hand's type only depends on which cards it has, not their
+# order, so it is looked up by the sorted hand in a table of all multisets
+# of five cards, one for each rule, worked out the first time it is needed.
+
+from functools import cache
+from itertools import count, combinations_with_replacement
+
+ORDER = '23456789TJQKA'
+JOKER_ORDER = 'J23456789TQKA'
+
+# a card's rank as a hex digit: the ranks of a hand read as one hex number
+RANKS = str.maketrans(ORDER, '0123456789abc')
+JOKER_RANKS = str.maketrans(JOKER_ORDER, '0123456789abc')
+
+# counts of the cards in a hand, largest first -> type, weakest first
+SHAPES = [ (1, 1, 1, 1, 1), (2, 1, 1, 1), (2, 2, 1), (3, 1, 1), (3, 2), (4, 1), (5,) ]
+TYPE_SHIFT = 20
+
+
+def partitions(n, most=None):
+    # n as sums of positive ints, largest first
+    if n == 0:
+        yield ()
+        return
+    for k in range(min(n, most or n), 0, -1):
+        for rest in partitions(n - k, k):
+            yield (k,) + rest
+
+def type_table():
+    # (counts of the cards other than jokers, largest first; jokers) -> type.
+    # jokers are best spent on the card there are most of already
+    shape_type = { shape: t for t, shape in enumerate(SHAPES) }
+    table = {}
+    for jokers in range(6):
+        for counts in partitions(5 - jokers):
+            shape = (counts[0] + jokers,) + counts[1:] if counts else (5,)
+            table[counts, jokers] = shape_type[shape]
+    return table
+
+def signature(hand, jokers=False):
+    if jokers:
+        n = hand.count('J')
+        hand = hand.replace('J', '')
+    else:
+        n = 0
+    counts = sorted(map(hand.count, set(hand)), reverse=True)
+    return tuple(counts), n
+
+@cache
+def multiset_table(jokers=False):
+    # the cards of a hand sorted -> its type, for all 6188 multisets of 5
+    types = type_table()
+    hands = map(''.join, combinations_with_replacement(sorted(ORDER), 5))
+    return { hand: types[signature(hand, jokers)] for hand in hands }
+
+
+def hand_key(hand, jokers=False):
+    types, ranks = multiset_table(jokers), (JOKER_RANKS if jokers else RANKS)
+    return types[''.join(sorted(hand))] << TYPE_SHIFT | int(hand.translate(ranks), 16)
+
+def winnings(hands, jokers=False):
+    # hands: (hand, bid) pairs. sum of bid * rank, ranks from 1 for the
+    # weakest hand
+    keys = [ hand_key(hand, jokers) for hand, _ in hands ]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return sum(hands[i][1] * rank for i, rank in zip(order, count(1)))
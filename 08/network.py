@@ -0,0 +1,296 @@
+# pyright: basic
+
+# the desert map with nodes as dense int ids: left and right successors in
+# two array('I') tables, and one table per instruction pointing at the one
+# it uses. on top of those, jump tables for whole passes over the
+# instructions: jumps[k][u] is where u is after 2^k passes. a walk of n
+# steps is then the bits of n // len(insts) worth of jumps plus at most one
+# pass of single steps. the first end node reached is found by walking a
+# pass at a time, or for long walks the same way, binary searching over
+# passes.
+#
+# for walks that never stop, orbit() describes every step at which a walk
+# is on an end node: the state (node, instruction index) comes back after a
+# tail, and from then on the hits repeat with the cycle. first_common()
+# combines the orbits of several walks with a generalized CRT.
+#
+# lockstep() is the brute force to check that against: ghosts stepped
+# together as a numpy array of node ids, one gather per instruction. a run
+# is cut into blocks of passes, one per process; each block is cut again
+# into lanes that are stepped side by side, every lane starting where
+# walk() says it should.
+
+import os, re
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from math import gcd
+from time import perf_counter
+
+NODE = re.compile(r'(\w+) = \((\w+), (\w+)\)')
+# how many runs of passes lockstep steps side by side
+LANES = 1024
+# steps_to walks pass by pass for up to len(network) // WALK_SHARE passes,
+# about what building its tables costs
+WALK_SHARE = 8
+
+
+# x = v[i] (mod m[i]) for all i, moduli need not be coprime.
+# returns (x, lcm(m)) like sympy's crt, or None if there is no solution
+def crt(m, v):
+    x, M = 0, 1
+    for mi, vi in zip(m, v):
+        g = gcd(M, mi)
+        if (vi - x) % g:
+            return None
+        # x + M*k = vi (mod mi)
+        k = (vi - x) // g * pow(M // g, -1, mi // g) % (mi // g)
+        x += M * k
+        M = M // g * mi
+        x %= M
+    return x, M
+
+
+@dataclass
+class Orbit:
+    # a walk is on an end node after n steps for the n <= tail in tail_hits,
+    # and for the n > tail with n % cycle in residues
+    tail: int
+    cycle: int
+    tail_hits: frozenset[int]
+    residues: frozenset[int]
+
+    def hits(self, n) -> bool:
+        if n <= self.tail:
+            return n in self.tail_hits
+        return n % self.cycle in self.residues
+
+    def hits_upto(self, stop) -> list[int]:
+        # the n <= stop it is on an end node after, in order
+        out = [ n for n in self.tail_hits if n <= stop ]
+        for r in self.residues:
+            first = self.tail + 1 + (r - self.tail - 1) % self.cycle
+            out.extend(range(first, stop + 1, self.cycle))
+        return sorted(out)
+
+
+class Network:
+    def __init__(self, insts, nodes):
+        # insts: string of L and R; nodes: name -> (left name, right name)
+        self.insts = insts
+        self.names = list(nodes)
+        self.ids = { name: u for u, name in enumerate(self.names) }
+        self.left  = array('I', ( self.ids[l] for l, _ in nodes.values() ))
+        self.right = array('I', ( self.ids[r] for _, r in nodes.values() ))
+        self.moves = [ self.right if c == 'R' else self.left for c in insts ]
+        # built on first use: walks that only visit a few nodes never need them
+        self.jumps = []
+        self.hits = {}
+
+    @classmethod
+    def from_file(cls, f):
+        insts = f.readline().strip()
+        f.readline()
+        data = ( NODE.match(line) for line in f )
+        nodes = { m[1]: (m[2], m[3]) for m in data if m }
+        return cls(insts, nodes)
+
+    def __len__(self):
+        return len(self.names)
+
+    def ends(self, suffix):
+        # ids of the nodes whose name ends with suffix
+        return { u for u, name in enumerate(self.names) if name.endswith(suffix) }
+
+    def step(self, u, n):
+        # the node after u, u being where a walk is after n steps
+        return self.moves[n % len(self.insts)][u]
+
+    def run_pass(self, us):
+        # where each of us is after one whole pass over the instructions
+        for move in self.moves:
+            us = array('I', map(move.__getitem__, us))
+        return us
+
+    def jump(self, k):
+        # the table for 2^k passes, built from the smaller ones as needed
+        if not self.jumps:
+            self.jumps.append(self.run_pass(array('I', range(len(self)))))
+        while len(self.jumps) <= k:
+            last = self.jumps[-1]
+            self.jumps.append(array('I', map(last.__getitem__, last)))
+        return self.jumps[k]
+
+    def walk(self, u, n):
+        # the node u is at after n steps
+        passes, rest = divmod(n, len(self.insts))
+        for k in range(passes.bit_length()):
+            if passes >> k & 1:
+                u = self.jump(k)[u]
+        for i in range(rest):
+            u = self.moves[i][u]
+        return u
+
+    def pass_hits(self, ends):
+        # first[u]: the first step (1..L) of a pass from u that lands on one
+        # of ends, 0 if none does. hit[k][u]: whether any of the next 2^k
+        # passes from u does
+        key = frozenset(ends)
+        if key not in self.hits:
+            first = array('I', bytes(4 * len(self)))
+            us = array('I', range(len(self)))
+            for n, move in enumerate(self.moves, 1):
+                us = array('I', map(move.__getitem__, us))
+                for start, u in enumerate(us):
+                    if u in key and not first[start]:
+                        first[start] = n
+            self.hits[key] = (first, [ bytearray(map(bool, first)) ])
+        return self.hits[key]
+
+    def steps_to(self, u, ends):
+        # fewest steps (at least one) from u to one of ends, None if never.
+        # a pass at a time until one lands on ends or starts on a node seen
+        # before; walks still going after len(self) // WALK_SHARE passes
+        # finish on the pass tables instead
+        L = len(self.insts)
+        seen = set()
+        for passes in range(max(len(self) // WALK_SHARE, 1)):
+            if u in seen:
+                return None
+            seen.add(u)
+            u, hits = self.pass_ends(u, ends)
+            if hits:
+                return passes * L + hits[0]
+        n = self.lifted_steps_to(u, ends)
+        return None if n is None else (passes + 1) * L + n
+
+    def lifted_steps_to(self, u, ends):
+        # steps_to by binary lifting over passes. the node at the start of a
+        # pass comes back within len(self) passes, so 2^k >= len(self)
+        # passes decide it
+        first, hit = self.pass_hits(ends)
+        top = max(len(self) - 1, 1).bit_length()
+        for k in range(len(hit), top + 1):
+            prev, jump = hit[k-1], self.jump(k-1)
+            hit.append(bytearray( a or prev[b] for a, b in zip(prev, jump) ))
+        passes = 0
+        for k in range(top, -1, -1):
+            if not hit[k][u]:
+                u = self.jump(k)[u]
+                passes += 1 << k
+        if not first[u]:
+            return None
+        return passes * len(self.insts) + first[u]
+
+    def pass_ends(self, u, ends):
+        # (node after a pass from u, the steps (1..L) of it that land on
+        # one of ends)
+        out = []
+        for n, move in enumerate(self.moves, 1):
+            u = move[u]
+            if u in ends:
+                out.append(n)
+        return u, out
+
+    def orbit(self, u, ends) -> Orbit:
+        # the states at the start of each pass are (node, 0), so the walk
+        # repeats from the first pass that starts on a node seen before.
+        # tail and cycle are whole passes; the state may come back a little
+        # earlier, but hits before tail are all listed so that is harmless
+        L = len(self.insts)
+        seen = {}
+        hits = []
+        while u not in seen:
+            j = seen[u] = len(seen)
+            u, pass_hits = self.pass_ends(u, ends)
+            hits += ( j * L + n for n in pass_hits )
+        tail = seen[u] * L
+        cycle = (len(seen) - seen[u]) * L
+        return Orbit(
+            tail, cycle,
+            frozenset( n for n in hits if n <= tail ),
+            frozenset( n % cycle for n in hits if n > tail ),
+        )
+
+
+def first_common(orbits):
+    # fewest steps (at least one) after which every orbit is on an end node
+    # at once, None if never
+    if not orbits:
+        return None
+    tail = max(o.tail for o in orbits)
+    # while some walk is still in its tail, go through one walk's hits
+    for n in orbits[0].hits_upto(tail):
+        if all(o.hits(n) for o in orbits):
+            return n
+    # past every tail each walk is periodic: one residue per walk has to
+    # hold at once. the combinations are merged a walk at a time, so the
+    # ones with no solution are dropped early and equal ones merge
+    sols = { (0, 1) }
+    for o in orbits:
+        sols = {
+            sol for x, M in sols for r in o.residues
+            if (sol := crt([M, o.cycle], [x, r])) is not None
+        }
+        if not sols:
+            return None
+    return min( tail + 1 + (x - tail - 1) % M for x, M in sols )
+
+
+def lockstep(net, starts, ends, first, passes, lanes=LANES):
+    # (the first step in passes [first, first + passes) (or a little after)
+    # after which every walk from starts is on an end node, None if none;
+    # steps simulated; seconds spent stepping)
+    import numpy as np
+    L = len(net.insts)
+    left, right = np.array(net.left, dtype=np.intp), np.array(net.right, dtype=np.intp)
+    moves = [ right if c == 'R' else left for c in net.insts ]
+    end = np.zeros(len(net), dtype=bool)
+    end[list(ends)] = True
+    lanes = max(1, min(lanes, passes))
+    per = -(-passes // lanes)
+    # lane j covers passes first + j * per on
+    cur = np.array([
+        [ net.walk(u, (first + j * per) * L) for u in starts ]
+        for j in range(lanes)
+    ], dtype=np.intp)
+    found = np.zeros(lanes, dtype=np.int64)
+    steps = 0
+    t0 = perf_counter()
+    for p in range(per):
+        for i, move in enumerate(moves):
+            cur = move[cur]
+            steps += 1
+            done = end[cur].all(axis=1)
+            if done.any():
+                found[done & (found == 0)] = p * L + i + 1
+                if found[0]:
+                    break
+        else:
+            continue
+        break
+    t = perf_counter() - t0
+    steps *= lanes
+    lane = np.flatnonzero(found)
+    if not len(lane):
+        return None, steps, t
+    j = int(lane[0])
+    return (first + j * per) * L + int(found[j]), steps, t
+
+def brute_force(net, starts, ends, passes, workers=None):
+    # (first step every walk is on an end node within passes, or None;
+    # steps simulated per second, all processes together)
+    from concurrent.futures import ProcessPoolExecutor
+    if passes <= 0:
+        return None, 0.0
+    workers = workers or os.cpu_count() or 1
+    # built once here and pickled to the workers with net
+    net.jump(passes.bit_length())
+    per = -(-passes // workers)
+    firsts = range(0, passes, per)
+    with ProcessPoolExecutor(workers) as pool:
+        found = list(pool.map(lockstep, repeat(net), repeat(starts), repeat(ends), firsts, repeat(per)))
+    # the processes step at the same time, so their rates add up
+    rate = sum( steps / t for _, steps, t in found if t > 0 )
+    hits = [ n for n, _, _ in found if n is not None ]
+    return (min(hits) if hits else None), rate
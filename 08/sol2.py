@@ -1,60 +1,30 @@
 #!/usr/bin/env python
 # pyright: basic
-import sys, re
-from itertools import cycle, count
-from sympy.ntheory.modular import crt
+import sys
+from network import Network, brute_force, first_common
 
 def parse_file(f):
-    instructions = f.readline().strip()
-    f.readline()
-    rg = re.compile(r'(\w+) = \((\w+), (\w+)\)')
-    data = (rg.match(line) for line in f)
-    data = ((m[1], m[2], m[3]) for m in data)
-    nodes = { node: (left, right) for node, left, right in data }
-    return instructions, nodes
+    return Network.from_file(f)
+
+def solve(net):
+    ends = net.ends('Z')
+    starts = sorted(net.ends('A'))
+    orbits = [ net.orbit(u, ends) for u in starts ]
+    for u, o in zip(starts, orbits):
+        print(f'{net.names[u]}: tail {o.tail}, cycle {o.cycle}, {len(o.tail_hits)} + {len(o.residues)} end nodes', file=sys.stderr)
+    return first_common(orbits)
+
+
+# brute force over the first passes passes through the instructions, to
+# check solve against or for when it can't be used. prints how fast it
+# goes to stderr: answers much past steps/s times a few minutes need solve
+def solve_brute(net, passes):
+    ends = net.ends('Z')
+    starts = sorted(net.ends('A'))
+    sol, rate = brute_force(net, starts, ends, passes)
+    print(f'{rate:.3g} steps/s', file=sys.stderr)
+    return sol
 
-def find_cycle(insts, nodes, start_node, start_i=0) -> tuple[str, int, int]:
-    seen = {} # first node will be added automatically
-    for u, n in follow(insts, nodes, start_node, start_i):
-        i = n % len(insts)
-        if start_n := seen.get((u, i)):
-            return (u, start_n, n)
-        seen[(u, i)] = n
-    else:
-        raise Exception('never')
-
-# yields (current node, n := instructions executed)
-# (n % len(insts)) gives index of NEXT instruction that will be executed
-def follow(insts, nodes, cur, start_n=0):
-    for n in count(start_n):
-        yield cur, n
-        i = n % len(insts)
-        cur = nodes[cur][insts[i] == 'R']
-        
-
-def solve(instructions, nodes):
-    cur = [ n for n in nodes.keys() if n[-1] == 'A' ]
-    zs  = [ 
-            next((v, n) for v, n in follow(instructions, nodes, u) if v[-1] == 'Z')
-            for u in cur
-    ]
-    print(zs)
-    cycles = [ find_cycle(instructions, nodes, v, n) for v, n in zs ]
-    print(cycles)
-    m = [ e - s for _, s, e in cycles ]
-    print(f'{m=}')
-    v = [ (s - 1) % m for (_, s), m in zip(zs, m) ]
-    print(f'{v=}')
-    return crt(m, v)
-
-    for n, instr in zip(count(1), cycle(instructions)):
-        cur = [ nodes[n][instr == 'R'] for n in cur ]
-        if any(n[-1] == 'Z' for n in cur):
-            print(f'{n=} {cur=}')
-            input()
-        if all(n[-1] == 'Z' for n in cur):
-            return n
-    
 def main(in_file=None):
     if in_file:
         file = open(in_file)
@@ -65,7 +35,11 @@ def main(in_file=None):
             file = sys.stdin
 
     data = parse_file(file)
-    sol = solve(*data)
+    # ./sol2.py input PASSES brute forces the first PASSES passes instead
+    if len(sys.argv) > 2:
+        sol = solve_brute(data, int(sys.argv[2]))
+    else:
+        sol = solve(data)
     print(f'Solution: {sol}')
     file.close()
 
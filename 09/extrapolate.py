@@ -0,0 +1,96 @@
+# pyright: basic
+
+# the sequences are polynomials sampled at x = 0 .. n-1, and the value of
+# that polynomial anywhere else is a fixed integer combination of the
+# samples (lagrange at equidistant nodes). one step forward the weights
+# are alternating binomials, (-1)^(n-1-j) C(n, j); one step back they are
+# (-1)^j C(n, j+1). the weights are worked out once per length and
+# position, and all sequences of one length are a single matrix-vector
+# product, in int64 when that can't overflow and in python ints otherwise.
+#
+# load_blocks reads the input into those per-length arrays directly, and
+# extrapolate_diffs does the puzzle's own difference table on them instead:
+# np.diff along the rows of a whole block at once, then newton's formula
+# on the last (or first) column of every order to go any number of steps.
+
+from functools import cache
+from math import comb, factorial, prod
+import numpy as np
+
+INT64_MAX = (1 << 63) - 1
+
+
+@cache
+def weights(n, x) -> tuple[int, ...]:
+    # w such that sum(w[j] * y[j]) is the value at x of the polynomial
+    # through the points (j, y[j]), j < n
+    out = []
+    for j in range(n):
+        num = prod( x - m for m in range(n) if m != j )
+        den = (-1) ** (n - 1 - j) * factorial(j) * factorial(n - 1 - j)
+        # the lagrange basis is an integer at integer x, this is exact
+        out.append(num // den)
+    return tuple(out)
+
+def position(n, steps=1, backwards=False):
+    # x that is steps past the last sample, or before the first
+    return -steps if backwards else n - 1 + steps
+
+def load_blocks(lines) -> dict[int, np.ndarray]:
+    # the sequences on lines by length, each length one 2-D array
+    by_len = {}
+    for line in lines:
+        if n := len(line.split()):
+            by_len.setdefault(n, []).append(line)
+    blocks = {}
+    for n, rows in by_len.items():
+        block = np.fromstring(' '.join(rows), dtype=np.int64, sep=' ').reshape(len(rows), n)
+        # numbers that don't fit come out clipped to the int64 range
+        if block.size and (block.max() == INT64_MAX or block.min() <= -INT64_MAX):
+            block = as_block([ list(map(int, row.split())) for row in rows ])
+        blocks[n] = block
+    return blocks
+
+def as_block(rows) -> np.ndarray:
+    try:
+        return np.array(rows, dtype=np.int64)
+    except OverflowError:
+        return np.array(rows, dtype=object)
+
+def largest(block) -> int:
+    return max(abs(int(block.max())), abs(int(block.min())), 1) if block.size else 1
+
+def extrapolate(block, steps=1, backwards=False) -> np.ndarray:
+    # the value of each row steps past its end (or before its start)
+    n = block.shape[1]
+    w = weights(n, position(n, steps, backwards))
+    if block.dtype != object and block.size:
+        # every product and partial sum stays below this
+        bound = sum(map(abs, w)) * largest(block)
+        if bound > INT64_MAX:
+            block = block.astype(object)
+    return block @ np.array(w, dtype=block.dtype)
+
+def extrapolate_diffs(block, steps=1, backwards=False) -> np.ndarray:
+    # the same values as extrapolate, from the difference table: with
+    # e[d] the last entry of the d-th differences, steps ahead is
+    # sum(C(steps + d - 1, d) * e[d]); back from the first entries the
+    # signs alternate
+    n = block.shape[1]
+    coeffs = [ comb(steps + d - 1, d) * (-1 if backwards else 1) ** d for d in range(n) ]
+    # the d-th differences are at most 2^d times the values
+    if block.dtype != object and sum(map(abs, coeffs)) * largest(block) << n > INT64_MAX:
+        block = block.astype(object)
+    out = np.zeros(len(block), dtype=block.dtype)
+    for c in coeffs:
+        if not block.any():
+            break
+        out += c * (block[:, 0] if backwards else block[:, -1])
+        block = np.diff(block, axis=1)
+    return out
+
+def total(values) -> int:
+    # sum of an array of extrapolated values without overflowing
+    if values.dtype != object and largest(values) * len(values) > INT64_MAX:
+        values = values.astype(object)
+    return int(values.sum())
@@ -1,37 +1,19 @@
 #!/usr/bin/env python
 
-import sys, re
-from itertools import pairwise
+import sys, os, re
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
+from extrapolate import extrapolate, extrapolate_diffs, load_blocks, total
 
 def parse_file(f):
-    return [ list(map(int, l.split())) for l in f ]
-
-def solve_one(seq, xhat=None):
-    # do aitken neville??
-    seq = seq[:]
-    n = len(seq) - 1
-    if xhat is None:
-        xhat = n + 1
-    for m in range(1, n):
-        for j in range(n - m + 1):
-            seq[j] = ( (xhat - j) * seq[j+1] - (xhat - j - m) * seq[j] ) / m
-    return int(seq[0])
-
-def solve_naive(seq):
-    rows = [seq]
-    while True:
-        input(f'{rows}')
-        last = rows[-1]
-        new = [ b - a for a, b in pairwise(last) ]
-        print(new)
-        if all(d == 0 for d in new):
-            break
-        rows.append(new)
-    res = sum(row[-1] for row in rows)
-    return res
-
-def solve(readings):
-    return sum(solve_one(seq, -1) for seq in readings)
+    return load_blocks(stream.lines(f))
+
+# the difference table itself, for all sequences of a length at once
+def solve_naive(blocks):
+    return sum(total(extrapolate_diffs(block, backwards=True)) for block in blocks.values())
+
+def solve(blocks):
+    return sum(total(extrapolate(block, backwards=True)) for block in blocks.values())
 
 def main():
     try:
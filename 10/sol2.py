@@ -5,6 +5,8 @@ from collections import namedtuple
 from itertools import chain, starmap
 
 def parse(file):
+    # plain str rows, not gridio's array: the walk reads one cell at a
+    # time, which is cheapest on str, and it needs no numpy
     return Grid(file.read().splitlines())
 
 def solve(grid):
@@ -95,8 +97,8 @@ class Grid:
     def neighbors(self, x, y, w, h):
         return ( self[x, y] for x, y in surroundings(x, y, w, h) if self.in_bounds(x, y) )
     def index(self, cell) -> Coords:
-        coord_iter = ( (x,y) for y in range(self.h) for x in range(self.w) )
-        return next(Coords(x,y) for x, y in coord_iter if self[x, y] == cell)
+        y = next(y for y, row in enumerate(self.rows) if cell in row)
+        return Coords(self.rows[y].index(cell), y)
 
 
 
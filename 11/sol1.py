@@ -3,23 +3,22 @@
 import sys, os, re
 import numpy as np
 from itertools import combinations
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from gridio import load_grid
 
 
 def parse(file):
-    return np.array( [[1 if c == '#' else 0 for c in line] for line in file.read().splitlines()])
+    return load_grid(file) == ord('#')
 
 def solve(grid):
-    coords = ( (x,y) for x in range(grid.shape[1]) for y in range(grid.shape[0]) )
-    galaxies = ( (x, y) for x, y in coords if grid[y, x] == 1 )
+    ys, xs = grid.nonzero()
+    galaxies = zip(xs.tolist(), ys.tolist())
 
+    # how many empty rows/cols come before each index
+    empty_rows = [0] + np.cumsum(~grid.any(axis=1)).tolist()
+    empty_cols = [0] + np.cumsum(~grid.any(axis=0)).tolist()
     def adjust(x, y):
-        for i in range(y):
-            if np.all(grid[i] == 0):
-                y += 1
-        for j in range(x):
-            if np.all(grid[:, j] == 0):
-                x += 1
-        return x, y
+        return x + empty_cols[x], y + empty_rows[y]
     galaxies = [ adjust(*g) for g in galaxies ]
 
     def dist(a, b):
@@ -1,8 +1,6 @@
 #!/usr/bin/env python
 
 import sys, os, re
-import numpy as np
-from itertools import combinations
 
 
 def parse(file):
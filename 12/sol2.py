@@ -3,8 +3,6 @@
 # pyright: basic
 
 import sys, os, re
-import numpy as np
-from itertools import combinations
 
 
 def parse(file):
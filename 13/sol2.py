@@ -3,11 +3,12 @@
 import sys, os, re
 import numpy as np
 from itertools import takewhile, count
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from gridio import load_grids
 
 
 def parse(file):
-    groups = file.read().split('\n\n')
-    return [ np.array( [[c for c in line] for line in group.splitlines() ]) for group in groups ]
+    return load_grids(file)
 
 def refl_indices(start, size):
     return takewhile(
@@ -3,26 +3,20 @@
 
 import sys, os, re
 import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from gridio import load_grid, to_str
 
+# tiles are the input bytes themselves
 class Tile:
-    EMPTY = 0
-    WALL = 1
-    ROCK = 2
-    def from_char(c):
-        return '.#O'.index(c)
-    def to_char(t):
-        return '.#O'[t]
+    EMPTY = ord('.')
+    WALL = ord('#')
+    ROCK = ord('O')
 
 def parse(file):
-    data = file.read().splitlines()
-    grid = np.empty( (len(data), len(data[0])), dtype='u1' )
-    for y, row in enumerate(data):
-        for x, c in enumerate(row):
-            grid[y, x] = Tile.from_char(c)
-    return grid
+    return load_grid(file)
 
 def print_grid(grid):
-    print( *(''.join(Tile.to_char(c) for c in row) for row in grid), sep='\n' )
+    print(to_str(grid))
 
 def slide_west(grid):
     h, w = grid.shape
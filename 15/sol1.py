@@ -2,11 +2,13 @@
 
 import sys, os, re
 from functools import reduce
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
 
 
 
 def parse(file):
-    return file.read().strip().split(',')
+    return ( s.strip() for s in stream.split(file, ',') )
 
 def hash(s):
     s = bytes(s, 'ascii')
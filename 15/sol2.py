@@ -2,12 +2,14 @@
 
 import sys, os, re
 from functools import reduce
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import stream
 from itertools import count
 
 
 
 def parse(file):
-    return file.read().strip().split(',')
+    return ( s.strip() for s in stream.split(file, ',') )
 
 def hash_x(s):
     s = bytes(s, 'ascii')
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# pyright: basic
+
+# repeatable timings for the solvers, and a baseline to compare them against.
+#   ./bench.py -n 10 --save             record bench-baseline.json
+#   ./bench.py -n 10 --check 0.2        fail if any part got >20% slower
+#   ./bench.py -t 60                    give up on a part after 60s a run
+#   ./bench.py --sweep 11.1 --sizes 100,200,400,800
+#                                       time against generated input size
+
+import sys, os, json, tempfile
+from dataclasses import replace
+from math import log
+from statistics import median, quantiles
+
+import run, gen
+
+BASELINE = os.path.join(run.ROOT, 'bench-baseline.json')
+PHASES = ('parse', 'solve')
+# differences below this many seconds are noise, whatever the ratio
+NOISE_FLOOR = 0.002
+
+
+def stats(samples):
+    samples = sorted(samples)
+    p95 = quantiles(samples, n=20, method='inclusive')[-1] if len(samples) > 1 else samples[0]
+    return { 'min': samples[0], 'median': median(samples), 'p95': p95 }
+
+def failed(res, timeout):
+    # the entry for a run that didn't get a solution; parts that time out
+    # are recorded with their limit and compared like any other error
+    if res.timed_out:
+        return { 'error': res.error, 'timeout': timeout }
+    return { 'error': res.error }
+
+def bench_job(job, repeat, timeout=run.TIMEOUT):
+    samples = { phase: [] for phase in PHASES }
+    # first run imports the module and warms the caches, it is not counted
+    first = run.run_job(job, timeout=timeout)
+    if first.error:
+        return failed(first, timeout)
+    for _ in range(repeat):
+        res = run.run_job(job, timeout=timeout)
+        if res.error:
+            return failed(res, timeout)
+        for phase in PHASES:
+            samples[phase].append(res.times[phase])
+    entry = { phase: stats(samples[phase]) for phase in PHASES }
+    entry['solution'] = repr(first.solution)
+    entry['repeat'] = repeat
+    return entry
+
+def bench(jobs, repeat, timeout=run.TIMEOUT):
+    results = {}
+    for job in jobs:
+        print(f'{job.name} ...', file=sys.stderr, flush=True)
+        results[job.name] = bench_job(job, repeat, timeout)
+    return results
+
+
+def sweep(job, sizes, repeat, seed=0, timeout=run.TIMEOUT):
+    # [(n, bench entry)] for generated inputs of each size
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            print(f'{job.name} n={n} ...', file=sys.stderr, flush=True)
+            path = os.path.join(tmp, f'input-{n}')
+            with open(path, 'w') as f:
+                f.write(gen.generate(job.day, n, seed))
+            rows.append((n, bench_job(replace(job, input=path), repeat, timeout)))
+    return rows
+
+def growth(rows, phase):
+    # slope of log(time) against log(n) between the two largest sizes
+    ok = [ (n, e[phase]['median']) for n, e in rows if 'error' not in e ]
+    if len(ok) < 2:
+        return None
+    (n0, t0), (n1, t1) = ok[-2:]
+    if t0 <= 0 or t1 <= 0:
+        return None
+    return log(t1 / t0) / log(n1 / n0)
+
+def report_sweep(job, rows, file=sys.stdout):
+    print(f'{job.name} {"n":>10} {"parse":>12} {"solve":>12}', file=file)
+    for n, e in rows:
+        if 'error' in e:
+            print(f'{"":5} {n:10} !! {e["error"]}', file=file)
+            continue
+        print(f'{"":5} {n:10} {run.fmt_time(e["parse"]["median"])} {run.fmt_time(e["solve"]["median"])}', file=file)
+    for phase in PHASES:
+        if (k := growth(rows, phase)) is not None:
+            print(f'{phase} grows like n^{k:.2f}', file=file)
+
+def plot_sweep(job, rows, path):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots()
+    ok = [ (n, e) for n, e in rows if 'error' not in e ]
+    for phase in PHASES:
+        ax.plot([ n for n, _ in ok ], [ e[phase]['median'] for _, e in ok ], 'o-', label=phase)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('n')
+    ax.set_ylabel('median time [s]')
+    ax.set_title(f'day {job.name}')
+    ax.legend()
+    fig.savefig(path)
+
+
+def compare(results, baseline, threshold) -> list[str]:
+    problems = []
+    for name, cur in results.items():
+        old = baseline.get(name)
+        if old is None or 'error' in old:
+            continue
+        if 'error' in cur:
+            problems.append(f'{name}: {cur["error"]}')
+            continue
+        if cur['solution'] != old['solution']:
+            problems.append(f'{name}: solution changed {old["solution"]} -> {cur["solution"]}')
+        for phase in PHASES:
+            t_old, t_new = old[phase]['median'], cur[phase]['median']
+            if t_new - t_old > NOISE_FLOOR and t_new > t_old * (1 + threshold):
+                problems.append(f'{name} {phase}: {run.fmt_time(t_old)} -> {run.fmt_time(t_new)}')
+    return problems
+
+def report(results, baseline=None, file=sys.stdout):
+    baseline = baseline or {}
+    print(f'{"":5} {"phase":6} {"min":>12} {"median":>12} {"p95":>12} {"base med":>12}', file=file)
+    for name, cur in results.items():
+        if 'error' in cur:
+            print(f'{name:5} !! {cur["error"]}', file=file)
+            continue
+        for phase in PHASES:
+            s = cur[phase]
+            old = baseline.get(name, {}).get(phase)
+            base = run.fmt_time(old['median']) if old else ''
+            print(f'{name:5} {phase:6} {run.fmt_time(s["min"])} {run.fmt_time(s["median"])} {run.fmt_time(s["p95"])} {base:>12}', file=file)
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='benchmark the solvers against a saved baseline')
+    ap.add_argument('days', nargs='*', help="day selectors, as for run.py")
+    ap.add_argument('-n', '--repeat', type=int, default=5)
+    ap.add_argument('-b', '--baseline', default=BASELINE)
+    ap.add_argument('--save', action='store_true', help='write results as the new baseline')
+    ap.add_argument('--check', type=float, metavar='RATIO',
+                    help='exit with failure if a median is slower than baseline by more than RATIO')
+    ap.add_argument('--sweep', metavar='DAY.PART', help='time one part on generated inputs instead')
+    ap.add_argument('--sizes', default='10,20,40,80', help='comma separated sizes for --sweep')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('-t', '--timeout', type=float, default=run.TIMEOUT, metavar='SECONDS',
+                    help=f'give up on a part after this long a run (default {run.TIMEOUT}, 0: no limit)')
+    ap.add_argument('--plot', metavar='FILE', help='save the sweep as a log-log plot (needs matplotlib)')
+    args = ap.parse_args()
+
+    if args.sweep:
+        jobs = run.select(run.discover(), [args.sweep])
+        if len(jobs) != 1 or jobs[0].day not in gen.GENERATORS:
+            sys.exit(f'no single part with an input generator matches {args.sweep}')
+        sizes = [ int(n) for n in args.sizes.split(',') ]
+        rows = sweep(jobs[0], sizes, args.repeat, args.seed, args.timeout)
+        report_sweep(jobs[0], rows)
+        if args.plot:
+            plot_sweep(jobs[0], rows, args.plot)
+        return
+
+    jobs = run.select(run.discover(), args.days)
+    results = bench(jobs, args.repeat, args.timeout)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    report(results, baseline)
+
+    if args.save:
+        # only overwrite the parts that were benchmarked this time
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline | results, f, indent=2)
+    if args.check is not None:
+        problems = compare(results, baseline, args.check)
+        for p in problems:
+            print(f'REGRESSION {p}')
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# pyright: basic
+
+# synthetic inputs of arbitrary size, in the same format as the real ones.
+#   ./gen.py 11 1000 > big-11        a 1000x1000 galaxy map
+#   ./gen.py 24 5000 -s 7            5000 hailstones, seed 7
+
+import sys, random
+from itertools import count, product
+from string import ascii_lowercase
+
+
+def names():
+    # two-letter names first, like the real inputs, then longer ones
+    for k in count(2):
+        for t in product(ascii_lowercase, repeat=k):
+            name = ''.join(t)
+            if name not in ('in', 'rx'):
+                yield name
+
+
+# 01: n lines of letters with a few digits and spelled-out digits mixed in
+def gen_01(n, rng):
+    words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+    lines = []
+    for _ in range(n):
+        parts = [ rng.choice(words) if rng.random() < 0.5 else ''.join(rng.choices(ascii_lowercase, k=rng.randint(1, 6)))
+                  for _ in range(rng.randint(1, 6)) ]
+        # every line needs a real digit for part 1
+        for _ in range(rng.randint(1, 3)):
+            parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append(''.join(parts) + '\n')
+    return ''.join(lines)
+
+# 03: engine schematic, n x n
+def gen_03(n, rng):
+    grid = [ ['.'] * n for _ in range(n) ]
+    for y in range(n):
+        x = rng.randrange(3)
+        while x < n:
+            if rng.random() < 0.15:
+                grid[y][x] = rng.choice('*#+$/@%&=-')
+                x += 1
+            else:
+                w = min(rng.randint(1, 3), n - x)
+                grid[y][x:x+w] = str(rng.randint(10**(w-1), 10**w - 1))
+                x += w
+            x += rng.randint(1, 5)
+    return ''.join(''.join(row) + '\n' for row in grid)
+
+# 04: n scratchcards, 10 winning numbers and 25 owned ones each
+def gen_04(n, rng):
+    width = len(str(n))
+    lines = []
+    for i in range(1, n + 1):
+        winning = rng.sample(range(1, 100), 10)
+        # most cards win nothing: with fewer than one match per card on
+        # average the copy counts of part 2 stay bounded however large n is.
+        # no card wins past the end of the table
+        matches = 0 if rng.random() < 0.7 else rng.randint(1, 3)
+        own = rng.sample(winning, min(matches, n - i))
+        own += rng.sample([ k for k in range(1, 100) if k not in winning ], 25 - len(own))
+        rng.shuffle(own)
+        lines.append(f'Card {i:{width}}: {" ".join(f"{k:2}" for k in winning)} | {" ".join(f"{k:2}" for k in own)}\n')
+    return ''.join(lines)
+
+# 05: an almanac with n seed numbers (n // 2 ranges for part 2) and seven
+# maps of 30 ranges each, numbers below 2^32 like the real ones
+def gen_05(n, rng):
+    top = 1 << 32
+    seeds = []
+    for _ in range(n // 2):
+        start = rng.randrange(top >> 1)
+        seeds += [start, rng.randint(1, top >> 8)]
+    out = ['seeds: ' + ' '.join(map(str, seeds)) + '\n']
+    for name in ['seed-to-soil', 'soil-to-fertilizer', 'fertilizer-to-water', 'water-to-light',
+                 'light-to-temperature', 'temperature-to-humidity', 'humidity-to-location']:
+        out.append(f'\n{name} map:\n')
+        cuts = sorted(rng.sample(range(top), 60))
+        for src, end in zip(cuts[::2], cuts[1::2]):
+            length = end - src
+            out.append(f'{rng.randrange(top - length)} {src} {length}\n')
+    return ''.join(out)
+
+# 07: n camel cards hands with bids, jokers included
+def gen_07(n, rng):
+    return ''.join(
+        f'{"".join(rng.choices("23456789TJQKA", k=5))} {rng.randint(1, 1000)}\n'
+        for _ in range(n)
+    )
+
+# 08: a network of n nodes. like the real ones, each start node (AAA and
+# up to five more ending in A) leads down a short tail into a loop with end
+# nodes on it (ZZZ on the first); the rest are junk pointing anywhere.
+# every loop has one end node at its last step, so the ghosts do meet
+def gen_08(n, rng):
+    n = max(n, 8)
+    ghosts = max(1, min(6, n // 40))
+    label = ( name.upper() for name in names() )
+    succ = {}
+    start = 'AAA'
+    tail = 3
+    for g in range(ghosts):
+        length = rng.randint(max(2, n // (4 * ghosts)), max(2, n // (2 * ghosts)))
+        path = [ start if g == 0 else next(label) + 'A' ]
+        path += [ next(label) + 'X' for _ in range(tail - 1 + length) ]
+        path[-1] = 'ZZZ' if g == 0 else next(label) + 'Z'
+        # sometimes a second end node halfway round
+        if length > 3 and rng.random() < 0.5:
+            path[tail + length // 2] = path[tail + length // 2][:-1] + 'Z'
+        for u, v in zip(path, path[1:] + [path[tail]]):
+            succ[u] = (v, v)
+    nodes = list(succ)
+    while len(nodes) < n:
+        nodes.append(next(label) + 'X')
+    for u in nodes[len(succ):]:
+        succ[u] = (rng.choice(nodes), rng.choice(nodes))
+    insts = ''.join(rng.choices('LR', k=max(1, int(n ** 0.5))))
+    lines = [ f'{insts}\n', '\n' ]
+    lines += [ f'{u} = ({l}, {r})\n' for u, (l, r) in succ.items() ]
+    return ''.join(lines)
+
+# 09: n sequences of 21 values of small random polynomials, like the real
+# readings
+def gen_09(n, rng):
+    lines = []
+    for _ in range(n):
+        coeffs = [ rng.randint(-5, 5) for _ in range(rng.randint(1, 7)) ]
+        x0 = rng.randint(-10, 10)
+        values = ( sum(c * (x0 + x) ** i for i, c in enumerate(coeffs)) for x in range(21) )
+        lines.append(' '.join(map(str, values)) + '\n')
+    return ''.join(lines)
+
+# 10: one closed pipe loop in an (n+2) x (n+2) field of junk pipes
+def gen_10(n, rng):
+    # the loop is a skyline: up the first column, across the tops of
+    # random-height columns, down the last column and back along the bottom
+    tops = [ rng.randrange(0, n - 1) for _ in range(n) ]
+    # the last column must only go down, or it would double back on itself
+    tops[-1] = n - 2
+    path = [ (0, y) for y in range(n - 1, tops[0], -1) ]
+    for x in range(n):
+        path.append((x, tops[x]))
+        if x + 1 < n:
+            step = 1 if tops[x+1] > tops[x] else -1
+            path += [ (x + 1, y) for y in range(tops[x], tops[x+1], step) ]
+    path += [ (n - 1, y) for y in range(tops[-1] + 1, n - 1) ]
+    path += [ (x, n - 1) for x in range(n - 1, 0, -1) ]
+
+    pipes = {
+        frozenset(((0,-1), (0, 1))): '|', frozenset(((-1, 0), (1, 0))): '-',
+        frozenset(((0,-1), (1, 0))): 'L', frozenset(((0,-1), (-1, 0))): 'J',
+        frozenset(((0, 1), (-1, 0))): '7', frozenset(((0, 1), (1, 0))): 'F',
+    }
+    grid = [ [ rng.choice('|-LJ7F') for _ in range(n + 2) ] for _ in range(n + 2) ]
+    for i, (x, y) in enumerate(path):
+        (px, py), (nx, ny) = path[i-1], path[(i+1) % len(path)]
+        grid[y+1][x+1] = pipes[frozenset(((px-x, py-y), (nx-x, ny-y)))]
+    # day 10 can't tell which pipe S stands for when counting crossings,
+    # so put it on a straight horizontal one, which never counts
+    sx, sy = rng.choice([ (x, y) for x, y in path if grid[y+1][x+1] == '-' ])
+    sx, sy = sx + 1, sy + 1
+    grid[sy][sx] = 'S'
+    # junk right next to S must not look like it connects to it
+    on_path = { (x + 1, y + 1) for x, y in path }
+    for (dx, dy), c in (((0,-1), '-'), ((0, 1), '-'), ((-1, 0), '|'), ((1, 0), '|')):
+        if (sx + dx, sy + dy) not in on_path:
+            grid[sy+dy][sx+dx] = c
+    return ''.join(''.join(row) + '\n' for row in grid)
+
+# 11: n x n galaxy map, with some empty rows and columns
+def gen_11(n, rng, density=0.02):
+    empty_rows = set(rng.sample(range(n), n // 10))
+    empty_cols = set(rng.sample(range(n), n // 10))
+    return ''.join(
+        ''.join(
+            '#' if y not in empty_rows and x not in empty_cols and rng.random() < density else '.'
+            for x in range(n)
+        ) + '\n'
+        for y in range(n)
+    )
+
+# 12: rows of n springs, some damaged, some unknown
+def gen_12(n, rng, rows=1000, unknown=0.4):
+    lines = []
+    for _ in range(rows):
+        conf = [ rng.choice('.#') for _ in range(n) ]
+        counts = [ len(s) for s in ''.join(conf).split('.') if s ]
+        if not counts:
+            conf[rng.randrange(n)] = '#'
+            counts = [ len(s) for s in ''.join(conf).split('.') if s ]
+        conf = [ '?' if rng.random() < unknown else c for c in conf ]
+        lines.append(f'{"".join(conf)} {",".join(map(str, counts))}\n')
+    return ''.join(lines)
+
+# 13: n x n mirror patterns, each with a perfect vertical reflection line
+# and a horizontal one that is off by exactly one smudge
+def gen_13(n, rng, patterns=100):
+    out = []
+    for _ in range(patterns):
+        hw, hh = n // 2, n // 2
+        crop = rng.randint(1, hw - 1)
+        q = [ [ rng.choice('.#') for _ in range(hw) ] for _ in range(hh) ]
+        top = [ row + row[::-1] for row in q ]
+        grid = top + top[::-1]
+        grid = [ row[:2*hw - crop] for row in grid ]
+        # only the columns left of the crop have no partner across the
+        # vertical line, so the smudge there leaves it intact
+        y, x = rng.randrange(hh), rng.randrange(crop)
+        grid[y][x] = '.' if grid[y][x] == '#' else '#'
+        out.append(''.join(''.join(row) + '\n' for row in grid))
+    return '\n'.join(out)
+
+# 14: n x n platform of round and cube rocks
+def gen_14(n, rng):
+    return ''.join(
+        ''.join(rng.choices('.#O', weights=(6, 2, 3), k=n)) + '\n'
+        for _ in range(n)
+    )
+
+# 19: n workflows in a tree under 'in', and 10n parts
+def gen_19(n, rng):
+    gen_name = names()
+    workflows = { 'in': [] }
+    pending = ['in']
+    while pending:
+        name = pending.pop(0)
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            if len(workflows) < n and rng.random() < 0.7:
+                target = next(gen_name)
+                workflows[target] = []
+                pending.append(target)
+            else:
+                target = rng.choice('AR')
+            rules.append(f'{rng.choice("xmas")}{rng.choice("<>")}{rng.randint(1, 4000)}:{target}')
+        if len(workflows) < n and rng.random() < 0.5:
+            fallback = next(gen_name)
+            workflows[fallback] = []
+            pending.append(fallback)
+        else:
+            fallback = rng.choice('AR')
+        workflows[name] = rules + [fallback]
+    lines = [ f'{name}{{{",".join(rules)}}}\n' for name, rules in workflows.items() ]
+    rng.shuffle(lines)
+    parts = [
+        '{' + ','.join(f'{v}={rng.randint(1, 4000)}' for v in 'xmas') + '}\n'
+        for _ in range(10 * n)
+    ]
+    return ''.join(lines) + '\n' + ''.join(parts)
+
+# 20: n binary counters of 12 flip-flops each, built like the real input:
+# every counter resets at its own period and they all feed into rx
+def gen_20(n, rng, bits=12):
+    gen_name = names()
+    lines = []
+    starts, inverters = [], []
+    final = next(gen_name)
+    for _ in range(n):
+        period = rng.randrange(1 << (bits - 1), 1 << bits) | 1
+        ffs = [ next(gen_name) for _ in range(bits) ]
+        conj, inv = next(gen_name), next(gen_name)
+        from_conj = []
+        for i, ff in enumerate(ffs):
+            outs = ffs[i+1:i+2]
+            if period >> i & 1:
+                outs.append(conj)
+            from_conj.append(not period >> i & 1 or i == 0)
+            lines.append(f'%{ff} -> {", ".join(outs)}\n')
+        conj_outs = [ ff for ff, back in zip(ffs, from_conj) if back ] + [inv]
+        lines.append(f'&{conj} -> {", ".join(conj_outs)}\n')
+        lines.append(f'&{inv} -> {final}\n')
+        starts.append(ffs[0])
+        inverters.append(inv)
+    lines.append(f'&{final} -> rx\n')
+    rng.shuffle(lines)
+    return f'broadcaster -> {", ".join(starts)}\n' + ''.join(lines)
+
+# 24: n hailstones, all hit by one rock thrown from a hidden position
+def gen_24(n, rng):
+    lo, hi = 200_000_000_000_000, 400_000_000_000_000
+    rock = [ rng.randint(lo, hi) for _ in range(3) ]
+    rock_v = [ rng.randint(-300, 300) for _ in range(3) ]
+    lines = []
+    for _ in range(n):
+        t = rng.randint(10**10, 10**12)
+        v = [ rng.choice([-1, 1]) * rng.randint(1, 300) for _ in range(3) ]
+        p = [ rp + (rv - hv) * t for rp, rv, hv in zip(rock, rock_v, v) ]
+        lines.append(f'{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}\n')
+    return ''.join(lines)
+
+
+GENERATORS = {
+    1: gen_01, 3: gen_03, 4: gen_04, 5: gen_05, 7: gen_07, 8: gen_08, 9: gen_09, 10: gen_10, 11: gen_11, 12: gen_12, 13: gen_13,
+    14: gen_14, 19: gen_19, 20: gen_20, 24: gen_24,
+}
+
+# smallest n each generator can make an input for, if not 0
+MIN_N = { 10: 3, 12: 1, 13: 4 }
+
+def generate(day, n, seed=0) -> str:
+    if n < MIN_N.get(day, 0):
+        raise ValueError(f'day {day} inputs need n >= {MIN_N.get(day, 0)}, got {n}')
+    return GENERATORS[day](n, random.Random(seed))
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='generate a synthetic puzzle input')
+    ap.add_argument('day', type=int, choices=sorted(GENERATORS))
+    ap.add_argument('n', type=int, help='size: grid side, number of records, ...')
+    ap.add_argument('-s', '--seed', type=int, default=0)
+    args = ap.parse_args()
+    if args.n < MIN_N.get(args.day, 0):
+        ap.error(f'day {args.day} inputs need n >= {MIN_N.get(args.day, 0)}')
+    sys.stdout.write(generate(args.day, args.n, args.seed))
+
+
+if __name__ == "__main__":
+    main()
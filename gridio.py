@@ -0,0 +1,55 @@
+# pyright: basic
+
+# character grids straight from the input file: the file is mmap'ed and the
+# rows are exposed as a 2-D uint8 array whose row stride skips the newlines,
+# so nothing is copied and no per-cell python objects are made.
+# the mapping is copy-on-write, days that move things around in the grid can
+# write to it without touching the file.
+#
+#   grid = load_grid(file)          grid[y, x] == ord('#')
+#   grids = load_grids(file)        blocks separated by blank lines
+
+import mmap
+import numpy as np
+
+
+def map_file(file):
+    # bytes-like view of the whole file; pipes and StringIO are read instead
+    try:
+        fd = file.fileno()
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_COPY)
+    except (AttributeError, OSError, ValueError):
+        data = file.read()
+        return bytearray(data.encode() if isinstance(data, str) else data)
+
+def grid_view(buf, start, end) -> np.ndarray:
+    # rows in buf[start:end], all the same width, newline separated
+    w = buf.find(b'\n', start, end)
+    w = (end if w == -1 else w) - start
+    h = (end - start + 1) // (w + 1)
+    return np.ndarray((h, w), dtype=np.uint8, buffer=buf, offset=start, strides=(w + 1, 1))
+
+def strip_end(buf):
+    end = len(buf)
+    while end > 0 and buf[end-1] in b'\r\n':
+        end -= 1
+    return end
+
+def load_grid(file) -> np.ndarray:
+    buf = map_file(file)
+    return grid_view(buf, 0, strip_end(buf))
+
+def load_grids(file) -> list[np.ndarray]:
+    buf = map_file(file)
+    end = strip_end(buf)
+    grids = []
+    start = 0
+    while start < end:
+        stop = buf.find(b'\n\n', start, end)
+        stop = end if stop == -1 else stop
+        grids.append(grid_view(buf, start, stop))
+        start = stop + 2
+    return grids
+
+def to_str(grid) -> str:
+    return '\n'.join(row.tobytes().decode() for row in grid)
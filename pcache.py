@@ -0,0 +1,138 @@
+# pyright: basic
+
+# on-disk cache of parsed inputs, so rerunning a day on the same input skips
+# the parser. entries are keyed by a hash of the input and of the code the
+# parser may depend on: the file it is in, the python files next to it (its
+# own solution and any helper modules of that day) and the shared ones at
+# the top level. editing any of them makes a new key. numpy arrays are
+# stored as .npy, everything else is pickled. least recently used entries are
+# evicted once the directory grows past max_bytes.
+
+import os, hashlib, pickle
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, '.parse-cache')
+MAX_BYTES = 256 << 20
+
+
+def file_digest(h, path):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+
+def sources(parser_path):
+    dirs = sorted({ os.path.dirname(os.path.abspath(parser_path)), ROOT })
+    return [
+        os.path.join(d, f)
+        for d in dirs for f in sorted(os.listdir(d)) if f.endswith('.py')
+    ]
+
+def make_key(input_path, parser_path):
+    h = hashlib.sha256()
+    # the parts of a day share their sources but not always their parser
+    h.update(os.path.basename(parser_path).encode() + b'\0\0')
+    for path in sources(parser_path):
+        h.update(os.path.basename(path).encode() + b'\0')
+        file_digest(h, path)
+    h.update(b'\0')
+    file_digest(h, input_path)
+    return h.hexdigest()
+
+def is_plain_array(value):
+    return type(value).__module__ == 'numpy' and type(value).__name__ == 'ndarray' \
+        and value.dtype != object
+
+
+class ParseCache:
+    def __init__(self, dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.dir = dir
+        self.max_bytes = max_bytes
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.dir)
+        except FileNotFoundError:
+            return []
+        return [ os.path.join(self.dir, n) for n in names if not n.startswith('.') ]
+
+    def get(self, key) -> tuple[bool, object]:
+        for ext in ('.npy', '.pickle'):
+            path = os.path.join(self.dir, key + ext)
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            try:
+                with f:
+                    if ext == '.npy':
+                        import numpy as np
+                        value = np.load(f)
+                    else:
+                        value = pickle.load(f)
+            except Exception:
+                # stale or written by an incompatible version: treat as a miss
+                os.remove(path)
+                continue
+            # mtime doubles as the last-used time for eviction. another
+            # process may have evicted the entry since it was read
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+            return True, value
+        return False, None
+
+    def put(self, key, value):
+        os.makedirs(self.dir, exist_ok=True)
+        ext = '.npy' if is_plain_array(value) else '.pickle'
+        path = os.path.join(self.dir, key + ext)
+        tmp = os.path.join(self.dir, f'.{key}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                if ext == '.npy':
+                    import numpy as np
+                    np.save(f, value, allow_pickle=False)
+                else:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # not everything a parser returns can be stored (open files,
+            # generators, very deep object graphs); those just aren't cached
+            os.remove(tmp)
+            return False
+        os.replace(tmp, path)
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        for path in self._entries():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for path in self._entries():
+            os.remove(path)
+
+    def parse(self, parse, file, parser_path) -> tuple[bool, object]:
+        # (hit, parsed data); parse(file) is only called on a miss.
+        # lazy parsers hand back generators, which can't be stored: those
+        # are returned as they are, still reading from file
+        key = make_key(file.name, parser_path)
+        hit, value = self.get(key)
+        if hit:
+            return True, value
+        value = parse(file)
+        self.put(key, value)
+        return False, value
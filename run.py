@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# pyright: basic
+
+# run many days in one interpreter, so python startup and numpy/sympy imports
+# are only paid once. usage:
+#   ./run.py                 all days, all parts
+#   ./run.py 3 5-9 14.2      days 3, 5 to 9 and part 2 of day 14
+#   ./run.py -j0             all days, spread over a process pool
+#   ./run.py -c              reuse parsed inputs from .parse-cache/
+#   ./run.py -t 0            no time limit (default: give up on a part
+#                            after TIMEOUT seconds and report it timed out)
+#   ./run.py --importtime 8  what each day pays for its imports, cold
+
+import sys, os, re, io, signal
+import importlib.util
+import subprocess
+import inspect
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout, contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+import pcache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOL_RX = re.compile(r'sol(\d*)\.py')
+INPUT_NAMES = ('input', 'input.txt', 'input1.txt')
+# (day, part) that take by far the longest; started first in parallel mode
+# so they overlap with everything else instead of trailing at the end
+HEAVY = [ (12, 2), (14, 2), (20, 2), (24, 1) ]
+# seconds a part gets before it is given up on; some brute force parts
+# never finish on the real inputs
+TIMEOUT = 30
+
+
+class JobTimeout(BaseException):
+    # a BaseException so that solvers catching Exception don't swallow it
+    pass
+
+
+@dataclass
+class Job:
+    day: int
+    part: int
+    path: str
+    input: str
+
+    @property
+    def dir(self):
+        return os.path.dirname(self.path)
+
+    @property
+    def name(self):
+        return f'{self.day:02}.{self.part}'
+
+@dataclass
+class Result:
+    job: Job
+    solution: Any = None
+    error: str | None = None
+    timed_out: bool = False
+    cached: bool = False
+    # seconds spent in each phase
+    times: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self):
+        return sum(self.times.values())
+
+    @property
+    def throughput(self):
+        # MB/s of input through parse and solve
+        t = self.times['parse'] + self.times['solve']
+        return os.path.getsize(self.job.input) / 1e6 / t if t > 0 else float('inf')
+
+
+def find_input(day_dir):
+    for name in INPUT_NAMES:
+        path = os.path.join(day_dir, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+def discover(root=ROOT) -> list[Job]:
+    jobs = []
+    for d in sorted(os.listdir(root)):
+        day_dir = os.path.join(root, d)
+        if not (d.isdigit() and os.path.isdir(day_dir)):
+            continue
+        inp = find_input(day_dir)
+        if inp is None:
+            continue
+        for f in sorted(os.listdir(day_dir)):
+            if m := SOL_RX.fullmatch(f):
+                part = int(m[1] or 1)
+                jobs.append(Job(int(d), part, os.path.join(day_dir, f), inp))
+    return jobs
+
+def select(jobs, specs) -> list[Job]:
+    # specs: '7', '3-5', '14.2'
+    if not specs:
+        return jobs
+    wanted = set()
+    for spec in specs:
+        days, _, part = spec.partition('.')
+        lo, _, hi = days.partition('-')
+        for day in range(int(lo), int(hi or lo) + 1):
+            wanted.add((day, int(part) if part else None))
+    return [ j for j in jobs if (j.day, None) in wanted or (j.day, j.part) in wanted ]
+
+
+@contextmanager
+def in_day_dir(day_dir):
+    # some days open files relative to their own directory
+    # or import sibling modules
+    old_cwd = os.getcwd()
+    os.chdir(day_dir)
+    sys.path.insert(0, day_dir)
+    try:
+        yield
+    finally:
+        sys.path.remove(day_dir)
+        os.chdir(old_cwd)
+
+def load_module(job: Job):
+    name = f'day{job.day:02}_{os.path.splitext(os.path.basename(job.path))[0]}'
+    if mod := sys.modules.get(name):
+        return mod
+    spec = importlib.util.spec_from_file_location(name, job.path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+def entry_points(mod):
+    parse = getattr(mod, 'parse', None) or getattr(mod, 'parse_file', None)
+    return parse, mod.solve
+
+def call_solve(solve, data):
+    # mirror what each main() does: some days return a tuple from parse
+    # and call solve(*data), others pass it through as a whole
+    if isinstance(data, tuple):
+        nparams = len(inspect.signature(solve).parameters)
+        if nparams == len(data):
+            return solve(*data)
+    return solve(data)
+
+@contextmanager
+def time_limit(seconds):
+    # raises JobTimeout once seconds have passed. needs SIGALRM, so it
+    # only works in the main thread; without it there is no limit
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+    def expire(signum, frame):
+        raise JobTimeout()
+    old = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old)
+
+def run_job(job: Job, quiet=True, cache=None, timeout=TIMEOUT) -> Result:
+    res = Result(job)
+    out = io.StringIO() if quiet else sys.stdout
+    try:
+        with time_limit(timeout), in_day_dir(job.dir), redirect_stdout(out):
+            t0 = perf_counter()
+            mod = load_module(job)
+            t1 = perf_counter()
+            parse, solve = entry_points(mod)
+            # the file stays open while solving: days without a parser, and
+            # parsers that stream, read it as they go
+            with open(job.input) as file:
+                if parse and cache:
+                    res.cached, data = cache.parse(parse, file, job.path)
+                else:
+                    data = parse(file) if parse else file
+                t2 = perf_counter()
+                res.solution = call_solve(solve, data)
+                t3 = perf_counter()
+        res.times = { 'import': t1 - t0, 'parse': t2 - t1, 'solve': t3 - t2 }
+    except KeyboardInterrupt:
+        raise
+    except JobTimeout:
+        res.timed_out = True
+        res.error = f'timed out after {timeout:g}s'
+    except BaseException as e:
+        res.error = f'{type(e).__name__}: {e}'
+    return res
+
+
+def schedule(jobs) -> list[Job]:
+    heavy = { key: i for i, key in enumerate(HEAVY) }
+    return sorted(jobs, key=lambda j: heavy.get((j.day, j.part), len(heavy)))
+
+def run_parallel(jobs, workers=None, quiet=True, cache=None, timeout=TIMEOUT) -> list[Result]:
+    # the time limit is kept by each worker, jobs run in their main thread
+    workers = workers or os.cpu_count()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = { pool.submit(run_job, job, quiet, cache, timeout): job for job in schedule(jobs) }
+        for fut in as_completed(futures):
+            res = fut.result()
+            print(f'{res.job.name} done', file=sys.stderr, flush=True)
+            results.append(res)
+    results.sort(key=lambda r: (r.job.day, r.job.part))
+    return results
+
+
+IMPORTTIME_RX = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+# imports the module in a fresh interpreter, like running the script would
+IMPORT_SNIPPET = '''
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location('sol', sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+'''
+
+def import_times(job: Job) -> list[tuple[float, str]]:
+    # [(cumulative seconds, module)] for the modules the solution imports
+    # itself, heaviest first; same numbers as python -X importtime
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SNIPPET, job.path],
+        cwd=job.dir, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    lines = proc.stderr.splitlines()
+    # everything imported before our snippet starts is interpreter startup
+    start = max(i for i, l in enumerate(lines) if l.endswith(' importlib.util'))
+    top = []
+    for line in lines[start+1:]:
+        if (m := IMPORTTIME_RX.match(line)) and len(m[3]) == 1:
+            top.append((int(m[2]) / 1e6, m[4]))
+    return sorted(top, reverse=True)
+
+def report_imports(jobs, file=sys.stdout):
+    for job in jobs:
+        try:
+            top = import_times(job)
+        except RuntimeError as e:
+            print(f'{job.name:5} !! {e}', file=file)
+            continue
+        heaviest = ', '.join(f'{name} {t*1000:.1f}ms' for t, name in top[:3])
+        print(f'{job.name:5} {fmt_time(sum(t for t, _ in top))}  {heaviest}', file=file)
+
+
+def fmt_time(t):
+    return f'{t*1000:10.2f}ms'
+
+def report(results, file=sys.stdout):
+    print(f'{"":5} {"import":>12} {"parse":>12} {"solve":>12} {"total":>12} {"MB/s":>8}  solution', file=file)
+    per_day = {}
+    for r in results:
+        if r.error:
+            print(f'{r.job.name:5} {"":>60}  !! {r.error}', file=file)
+            continue
+        t = r.times
+        mark = '*' if r.cached else ' '
+        print(f'{r.job.name:5} {fmt_time(t["import"])} {fmt_time(t["parse"])}{mark}{fmt_time(t["solve"])} {fmt_time(r.total)} {r.throughput:8.2f}  {r.solution}', file=file)
+        per_day[r.job.day] = per_day.get(r.job.day, 0) + r.total
+    print(file=file)
+    for day, t in per_day.items():
+        print(f'day {day:02} {fmt_time(t)}', file=file)
+    print(f'total  {fmt_time(sum(per_day.values()))}', file=file)
+    if any(r.cached for r in results):
+        print('* parsed input loaded from cache', file=file)
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='run several AoC days in one process')
+    ap.add_argument('days', nargs='*', help="day selectors: '7', '3-5', '14.2'")
+    ap.add_argument('-v', '--verbose', action='store_true', help="don't swallow the solvers' own output")
+    ap.add_argument('-j', '--jobs', type=int, metavar='N',
+                    help='run in a pool of N processes (0: one per core)')
+    ap.add_argument('-c', '--cache', action='store_true', help='cache parsed inputs on disk')
+    ap.add_argument('--cache-size', type=int, default=pcache.MAX_BYTES >> 20, metavar='MB')
+    ap.add_argument('-t', '--timeout', type=float, default=TIMEOUT, metavar='SECONDS',
+                    help=f'give up on a part after this long (default {TIMEOUT}, 0: no limit)')
+    ap.add_argument('--importtime', action='store_true',
+                    help='only report cold import times of the selected days')
+    args = ap.parse_args()
+
+    if args.importtime:
+        report_imports(select(discover(), args.days))
+        return
+
+    jobs = select(discover(), args.days)
+    quiet = not args.verbose
+    cache = pcache.ParseCache(max_bytes=args.cache_size << 20) if args.cache else None
+    t0 = perf_counter()
+    if args.jobs is not None:
+        results = run_parallel(jobs, args.jobs, quiet, cache, args.timeout)
+    else:
+        results = []
+        for job in jobs:
+            print(f'{job.name} ...', file=sys.stderr, flush=True)
+            results.append(run_job(job, quiet, cache, args.timeout))
+    wall = perf_counter() - t0
+    report(results)
+    print(f'wall   {fmt_time(wall)}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# pyright: basic
+
+# bounded-memory readers for the days where every record stands on its own.
+# input is read chunk_size characters at a time and records are handed out
+# as they are completed, so a solver that folds over them runs in constant
+# memory however big the input (or stdin pipe) is.
+
+CHUNK = 1 << 16
+
+
+def split(file, sep='\n', chunk_size=CHUNK):
+    # records separated by sep, without the separator; a trailing empty
+    # record (input ending in sep) is dropped
+    rest = ''
+    while chunk := file.read(chunk_size):
+        *done, rest = (rest + chunk).split(sep)
+        yield from done
+    if rest:
+        yield rest
+
+def lines(file, chunk_size=CHUNK):
+    return split(file, '\n', chunk_size)
+
+def blocks(file, chunk_size=CHUNK << 4):
+    # bytes holding whole lines only, about chunk_size at a time; for
+    # solvers that work on many lines at once
+    file = getattr(file, 'buffer', file)
+    rest = b''
+    while chunk := file.read(chunk_size):
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        cut = chunk.rfind(b'\n') + 1
+        if cut == 0:
+            rest += chunk
+            continue
+        yield rest + chunk[:cut]
+        rest = chunk[cut:]
+    if rest:
+        yield rest + b'\n'